@@ -1,7 +1,7 @@
-import copy
 import threading
 import logging
 
+from copy import deepcopy
 from typing import NoReturn
 
 
@@ -11,6 +11,10 @@ class Worker(threading.Thread):
 
     A Worker is a thread-safe object which performs some work on a given input. It may produce an output, but that is
     dependent on the implementation of the subclass.
+
+    The output follows a single-writer, many-reader contract. Only the Worker itself sets its output, and it does so by
+    rebinding `_output` to a new object, which is atomic. Readers therefore never need to acquire a lock, and always
+    see either the previous or the new output.
     """
 
     def __init__(self):
@@ -20,9 +24,9 @@ class Worker(threading.Thread):
         super().__init__()
 
         self._logger = logging.getLogger(__name__)
+        self._cls_name = self.__class__.__name__
 
         self._output = None
-        self._output_lock = threading.Lock()
 
     def run(self) -> NoReturn:
         """
@@ -31,18 +35,28 @@ class Worker(threading.Thread):
         This method is called when the Worker's start() method is called. It should be overridden by all subclasses, and
         should call this superclass method at the start of the subclass method.
         """
-        self._logger.debug(f"{self.__class__.__name__} started.")
+        self._logger.debug("%s started.", self._cls_name)
         self._set_output(None)
 
-    def get_output(self) -> NoReturn:
+    def get_output(self, copy: bool = False) -> any:
         """
         Retrieves the Worker's output, if any.
 
+        By default, a reference to the output is returned, so callers must treat it as read-only. If the caller needs
+        to modify the output, then a deepcopy can be requested instead.
+
+        :param copy: Whether to return a deepcopy of the output, rather than a reference to it.
+
         :return: Worker's output, if any.
         """
-        with self._output_lock:
+        output = self._output
+
+        if copy:
             self._logger.debug("Returning a deepcopy of `_output`.")
-            return copy.deepcopy(self._output)
+            return deepcopy(output)
+
+        self._logger.debug("Returning a reference to `_output`.")
+        return output
 
     def _set_output(self, output: any) -> any:
         """
@@ -50,6 +64,7 @@ class Worker(threading.Thread):
 
         :param output: New output.
         """
-        with self._output_lock:
-            self._logger.debug(f"Setting `_output` to:\n{output}.")
-            self._output = output
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Setting `_output` to:\n%s.", output)
+
+        self._output = output
@@ -1,7 +1,7 @@
 import threading
 
 from src.working_class import Worker
-from typing import NoReturn
+from typing import ClassVar, Dict, NoReturn
 
 
 class MachineLearningWorker(Worker):
@@ -12,75 +12,204 @@ class MachineLearningWorker(Worker):
     model. It may produce an output, but that is dependent on the implementation of the subclass.
     """
 
-    _MODEL = None
-    """Model to be used by the MachineLearningWorker."""
-    _MODEL_LOCK = threading.Lock()
-    """Lock for the model."""
+    _MODELS: ClassVar[Dict[type, object]] = {}
+    """Models to be used by each subclass of MachineLearningWorker. A subclass' entry is only ever changed while holding
+    its lock from `_MODEL_LOCKS`."""
+    _MODEL_LOCKS: ClassVar[Dict[type, threading.Lock]] = {}
+    """Locks for loading and unloading the model of each subclass of MachineLearningWorker."""
+    _MODEL_LOADED_EVENTS: ClassVar[Dict[type, threading.Event]] = {}
+    """Events which are set while the model of each subclass of MachineLearningWorker is loaded."""
 
-    def __init__(self):
+    def __init__(self, load_model: callable = None, unload_model: callable = None, preload_model: bool = False):
         """
         Constructs a new MachineLearningWorker.
+
+        If both functions are given, they are registered using `register_model_loader`. Otherwise, subclasses must call
+        `register_model_loader` before the model is loaded or unloaded.
+
+        :param load_model: A callable function which loads and returns the model.
+        :param unload_model: A callable function which accepts, and unloads, the model.
+        :param preload_model: Whether to start loading the model on a background daemon thread, so that it is ready
+                              before it is first needed. Use `wait_for_model` to wait for it to finish loading.
+
+        :raises ValueError: If the model is to be preloaded, but no `load_model` function was given.
         """
         super().__init__()
 
-        self._model = None
         self._model_lock = threading.Lock()
+        self._model_loader = None
+        self._model_unloader = None
+        self._preload_finished = None
+        self._preload_error = None
 
-    def _load_model(self, load_model: callable) -> NoReturn:
+        if load_model is not None or unload_model is not None:
+            self.register_model_loader(load_model, unload_model)
+
+        if preload_model:
+            if self._model_loader is None:
+                raise ValueError("A `load_model` function must be given to preload the model.")
+
+            self._logger.debug("Preloading model for %s.", self._cls_name)
+            self._preload_finished = threading.Event()
+            threading.Thread(target=self._preload_model, daemon=True).start()
+
+    def _get_model_lock(self) -> threading.Lock:
         """
-        Attempts to load the model by calling the given function. If the model is already loaded, this method does
-        nothing.
+        Retrieves the lock for loading and unloading the model of this worker's class, creating it if necessary.
 
-        :param load_model: A callable function which loads and returns the model.
+        Each subclass has its own lock, so that loading one subclass' model does not block workers of other subclasses.
+
+        :return: Lock for the model of this worker's class.
         """
-        if load_model is None:
-            raise ValueError("Load model function cannot be None.")
+        lock = MachineLearningWorker._MODEL_LOCKS.get(type(self))
+        if lock is None:
+            lock = MachineLearningWorker._MODEL_LOCKS.setdefault(type(self), threading.Lock())
 
-        if not callable(load_model):
-            raise ValueError("Load model function must be callable.")
+        return lock
+
+    def _get_model_loaded_event(self) -> threading.Event:
+        """
+        Retrieves the event which is set while the model of this worker's class is loaded, creating it if necessary.
+
+        :return: Event for the model of this worker's class.
+        """
+        event = MachineLearningWorker._MODEL_LOADED_EVENTS.get(type(self))
+        if event is None:
+            event = MachineLearningWorker._MODEL_LOADED_EVENTS.setdefault(type(self), threading.Event())
+
+        return event
+
+    def _preload_model(self) -> NoReturn:
+        """
+        Loads the model on behalf of a preload, recording any exception which is raised so that `wait_for_model` can
+        re-raise it, and then signals that the preload has finished.
+        """
+        try:
+            self._load_model()
+        except Exception as e:
+            self._logger.exception("Failed to preload model for %s.", self._cls_name)
+            self._preload_error = e
+        finally:
+            self._preload_finished.set()
+
+    def _load_model(self) -> NoReturn:
+        """
+        Attempts to load the model by calling the registered `load_model` function. If the model is already loaded,
+        this method does nothing.
+
+        The lock is only acquired when the model has not been loaded yet, and the check is repeated once it is held, so
+        that the model is loaded exactly once.
+
+        :raises RuntimeError: If the model must be loaded, but no `load_model` function has been registered.
+        """
+        if MachineLearningWorker._MODELS.get(type(self)) is not None:
+            return
+
+        with self._get_model_lock():
+            self._logger.debug("Starting to load model for %s.", self._cls_name)
+
+            if MachineLearningWorker._MODELS.get(type(self)) is None:
+                if self._model_loader is None:
+                    raise RuntimeError("No `load_model` function has been registered.")
+
+                self._logger.debug("Calling registered `load_model` function.")
+                MachineLearningWorker._MODELS[type(self)] = self._model_loader()
+                self._get_model_loaded_event().set()
+
+            self._logger.debug("Finished loading model for %s.", self._cls_name)
+
+    def _unload_model(self) -> NoReturn:
+        """
+        Attempts to unload the model by calling the registered `unload_model` function. If the model is already
+        unloaded, this method does nothing.
+
+        The last reference to the model is only released once the lock has been released, so that freeing the model
+        does not block other workers.
+
+        :raises RuntimeError: If the model must be unloaded, but no `unload_model` function has been registered.
+        """
+        with self._get_model_lock():
+            self._logger.debug("Starting to unload model for %s.", self._cls_name)
 
-        with MachineLearningWorker._MODEL_LOCK:
-            self._logger.debug(f"Starting to load model for {self.__class__.__name__}.")
+            model = MachineLearningWorker._MODELS.get(type(self))
 
-            if MachineLearningWorker._MODEL is None:
-                self._logger.debug(f"Calling provided `load_model` function.")
-                MachineLearningWorker._MODEL = load_model()
+            if model is not None:
+                if self._model_unloader is None:
+                    raise RuntimeError("No `unload_model` function has been registered.")
 
-            self._logger.debug(f"Finished loading model for {self.__class__.__name__}.")
+                self._logger.debug("Calling registered `unload_model` function.")
+                self._model_unloader(model)
 
-            self._model = MachineLearningWorker._MODEL
+                self._get_model_loaded_event().clear()
+                del MachineLearningWorker._MODELS[type(self)]
 
-    def _unload_model(self, unload_model: callable) -> NoReturn:
+        del model
+
+        self._logger.debug("Finished unloading model for %s.", self._cls_name)
+
+    def get_model(self) -> object:
         """
-        Attempts to unload the model by calling the given function. If the model is already unloaded, this method does
-        nothing.
+        Retrieves a reference to the MachineLearningWorker's model.
+
+        The model is read from the shared `_MODELS` entry of this worker's class, without acquiring a lock. Workers do
+        not pin their own reference to it, so once any worker of the class unloads the model, every worker sees that it
+        has been unloaded, and the model can be freed.
+
+        :return: MachineLearningWorker's model, or None if it is not loaded.
+        """
+        self._logger.debug("Returning a reference to the model of %s.", self._cls_name)
+        return MachineLearningWorker._MODELS.get(type(self))
+
+    def register_model_loader(self, load_model: callable, unload_model: callable) -> NoReturn:
+        """
+        Registers the functions which are used to load and unload the model.
+
+        Both functions are validated once, here, so that loading and unloading the model does not need to re-validate
+        them on each call.
+
+        :param load_model: A callable function which loads and returns the model.
+        :param unload_model: A callable function which accepts, and unloads, the model.
 
-        :param unload_model: A callable function which unloads the model.
+        :raises ValueError: If either function is None, or is not callable.
         """
+        if load_model is None:
+            raise ValueError("Load model function cannot be None.")
+
+        if not callable(load_model):
+            raise ValueError("Load model function must be callable.")
+
         if unload_model is None:
             raise ValueError("Unload model function cannot be None.")
 
         if not callable(unload_model):
             raise ValueError("Unload model function must be callable.")
 
-        with MachineLearningWorker._MODEL_LOCK:
-            self._logger.debug(f"Starting to unload model for {self.__class__.__name__}")
+        self._logger.debug("Registering model loader for %s.", self._cls_name)
+        self._model_loader = load_model
+        self._model_unloader = unload_model
 
-            if MachineLearningWorker._MODEL is not None:
-                self._logger.debug(f"Calling provided `unload_model` function.")
-                unload_model(MachineLearningWorker._MODEL)
+    def wait_for_model(self, timeout: float = None) -> bool:
+        """
+        Waits for the model of this worker's class to be loaded, such as by a preload.
 
-                del MachineLearningWorker._MODEL
-                MachineLearningWorker._MODEL = None
+        If this worker is preloading the model, then this waits for the preload to finish, rather than for the model to
+        be loaded, so that a failed preload does not cause this to wait indefinitely.
 
-            self._logger.debug(f"Finished unloading model for {self.__class__.__name__}.")
+        :param timeout: Maximum number of seconds to wait, or None to wait indefinitely.
 
-    def get_model(self) -> object:
-        """
-        Retrieves a reference to the MachineLearningWorker's model.
+        :return: Whether the model is loaded.
 
-        :return: MachineLearningWorker's model.
+        :raises Exception: If this worker's preload failed, the exception raised while loading the model.
         """
-        with MachineLearningWorker._MODEL_LOCK:
-            self._logger.debug(f"Returning a reference to the model of {self.__class__.__name__}.")
-            return MachineLearningWorker._MODEL
+        self._logger.debug("Waiting for the model of %s to be loaded.", self._cls_name)
+
+        if self._preload_finished is not None:
+            if not self._preload_finished.wait(timeout):
+                return False
+
+            if self._preload_error is not None:
+                raise self._preload_error
+
+            return self._get_model_loaded_event().is_set()
+
+        return self._get_model_loaded_event().wait(timeout)
@@ -1,40 +1,328 @@
+import asyncio
+import logging
 import threading
+import xxhash
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from src.working_class.machine_learning import MachineLearningWorker
+from src.working_class.validation import validate_argument
 from theine import Cache
 from theine.theine import CORES
-from typing import Hashable, NoReturn
+from typing import Hashable, List, NamedTuple, NoReturn, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_MISSING = object()
+"""Sentinel returned by the cache when a key is not found."""
+
+
+class _QuantizedEmbedding(NamedTuple):
+    """
+    An FP32 embedding which has been quantized to INT8, for storage in the cache.
+    """
+
+    values: any
+    """Quantized values of the embedding."""
+    scale: float
+    """Scale by which the quantized values must be multiplied, to approximate the original values."""
 
 
 class EmbeddingWorker(MachineLearningWorker):
-    def __init__(self, enable_cache: bool = True):
+    """
+    Base class for an EmbeddingWorker.
+
+    An EmbeddingWorker is a MachineLearningWorker which produces embeddings, and which can keep them in an in-memory
+    cache for reuse.
+
+    The cache is guarded by an exclusive lock, rather than a reader-writer lock, because Theine's cache is not
+    thread-safe and even a lookup mutates it (e.g. recency/frequency metadata and hit statistics). The lock is only held
+    for the cache operation itself. Checking whether the cache is enabled is a single, atomic read of `_cache`, so it
+    is first done before the lock is acquired, to return quickly when the cache is disabled. It is then repeated once the
+    lock is held, so that an operation always uses the current cache, and never one which has been replaced and is
+    being disposed of.
+    """
+
+    def __init__(
+        self,
+        enable_cache: bool = True,
+        load_model: callable = None,
+        unload_model: callable = None,
+        preload_model: bool = False
+    ):
         """
         Constructs a new EmbeddingWorker.
 
         :param enable_cache: Whether to use an in-memory cache to temporarily store embeddings for reuse.
+        :param load_model: A callable function which loads and returns the model.
+        :param unload_model: A callable function which accepts, and unloads, the model.
+        :param preload_model: Whether to start loading the model on a background daemon thread, so that it is ready
+                              before it is first needed.
         """
-        super().__init__()
+        super().__init__(load_model, unload_model, preload_model)
 
         self._cache = None
         self._cache_lock = threading.Lock()
-        self._cache_eviction_policy = "lru"
+        self._cache_eviction_policy = "tlfu"
         self._cache_size = 1024
         self._cache_ttl = timedelta(seconds=60)
+        self._cache_keys = OrderedDict()
+        self._cache_quantization = False
+        self._cache_executor = None
+        self._cache_executor_lock = threading.Lock()
 
         if enable_cache:
             self._create_cache()
 
     def _create_cache(self) -> NoReturn:
         """
-        Creates a new cache.
+        Creates a new cache, if the cache is not already enabled.
+
+        The new cache is constructed before the lock is acquired, and is only installed if no other thread has enabled
+        the cache in the meantime. Otherwise, it is disposed of.
         """
+        self._logger.debug("Creating a new cache for %s.", self._cls_name)
+
+        cache = Cache(
+            self._cache_eviction_policy,
+            self._cache_size
+        )
+
         with self._cache_lock:
-            self._logger.debug(f"Creating a new cache for {self.__class__.__name__}.")
-            self._cache = Cache(
-                self._cache_eviction_policy,
-                self._cache_size
-            )
+            if self._cache is None:
+                self._cache = cache
+                self._cache_keys.clear()
+                cache = None
+
+        if cache is not None:
+            self._dispose_of_cache(cache)
+
+    def _rebuild_cache(self, policy: str, size: int) -> NoReturn:
+        """
+        Sets the eviction policy and size of the cache, then replaces the cache with a new one using them, and carries
+        over the most recently used entries which are still cached and which fit within the new size. When growing the
+        cache, every live entry is carried over.
+
+        The new cache is constructed before the lock is acquired, and the settings and cache are then swapped together,
+        so that other threads never see a cache which does not match the settings.
+
+        Theine does not expose the remaining TTL of an entry, so carried over entries are given a fresh TTL.
+
+        If the cache is not enabled, only the settings are changed.
+
+        :param policy: New cache eviction policy.
+        :param size: New cache size.
+        """
+        new_cache = None if self._cache is None else Cache(policy, size)
+
+        with self._cache_lock:
+            self._cache_eviction_policy = policy
+            self._cache_size = size
+
+            old_cache = self._cache
+            if old_cache is None:
+                unused_cache = new_cache
+            else:
+                self._logger.debug("Rebuilding cache for %s.", self._cls_name)
+
+                if new_cache is None:
+                    new_cache = Cache(policy, size)
+
+                keys = list(self._cache_keys.values())[-size:]
+                self._cache_keys.clear()
+
+                for key in keys:
+                    value = old_cache.get(key, _MISSING)
+                    if value is not _MISSING:
+                        self._set_in_cache(new_cache, key, value)
+
+                self._cache = new_cache
+                unused_cache = old_cache
+
+        if unused_cache is not None:
+            self._dispose_of_cache(unused_cache)
+
+    def _dispose_of_cache(self, cache: Cache) -> NoReturn:
+        """
+        Clears and closes a cache, which is no longer in use, on a background daemon thread.
+
+        Freeing every cached value, and waiting for the cache's maintenance thread to stop, can take a while. Doing so
+        in the background keeps that work off of the calling thread, and out of any critical section.
+
+        :param cache: Cache to dispose of.
+        """
+        def dispose() -> NoReturn:
+            cache.clear()
+            cache.close()
+
+        self._logger.debug("Disposing of a cache for %s.", self._cls_name)
+        threading.Thread(target=dispose, daemon=True).start()
+
+    def _get_cache_executor(self) -> ThreadPoolExecutor:
+        """
+        Retrieves the thread pool used by the asynchronous cache methods, creating it on first use.
+
+        The pool has a single thread, as every cache operation is serialized by the cache lock, so further threads would
+        only wait on that lock.
+
+        :return: Thread pool used by the asynchronous cache methods.
+        """
+        executor = self._cache_executor
+        if executor is not None:
+            return executor
+
+        with self._cache_executor_lock:
+            if self._cache_executor is None:
+                self._logger.debug("Creating a cache executor for %s.", self._cls_name)
+                self._cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self._cls_name}-cache")
+
+            return self._cache_executor
+
+    @staticmethod
+    def _normalize_key(key: Hashable) -> Hashable:
+        """
+        Normalizes a key before it is used with the cache.
+
+        String and bytes keys, such as the raw text being embedded, are replaced by their 128-bit XXH3 digest. This
+        keeps the keys stored by the cache short, regardless of the length of the input text. All other keys are
+        returned as-is.
+
+        XXH3 hashes a string through its UTF-8 encoding, so the digest is prefixed with the key's type. This keeps a
+        string key, and a bytes key containing its encoding, as separate entries. e.g. "a" and b"a".
+
+        :param key: Key to normalize.
+
+        :return: Normalized key.
+        """
+        if isinstance(key, str):
+            return "str:" + xxhash.xxh3_128_hexdigest(key)
+
+        if isinstance(key, bytes):
+            return "bytes:" + xxhash.xxh3_128_hexdigest(key)
+
+        return key
+
+    def _encode_cache_value(self, value: any) -> any:
+        """
+        Prepares a value for storage in the cache.
+
+        If quantization is enabled and the value is an FP32 numpy array, then it is quantized to INT8 using symmetric,
+        per-embedding scaling. Arrays containing NaN or infinite values cannot be scaled, so they are returned as-is, as
+        are all other values.
+
+        :param value: Value to encode.
+
+        :return: Encoded value.
+        """
+        if not self._cache_quantization or not isinstance(value, numpy.ndarray) or value.dtype != numpy.float32:
+            return value
+
+        scale = float(numpy.abs(value).max()) / 127 if value.size > 0 else 0.0
+        if not numpy.isfinite(scale):
+            return value
+
+        if scale == 0.0:
+            scale = 1.0
+
+        return _QuantizedEmbedding(numpy.round(value / scale).astype(numpy.int8), scale)
+
+    @staticmethod
+    def _decode_cache_value(value: any) -> any:
+        """
+        Restores a value which was retrieved from the cache.
+
+        Quantized embeddings are dequantized to FP32 numpy arrays. All other values are returned as-is.
+
+        :param value: Value to decode.
+
+        :return: Decoded value.
+        """
+        if isinstance(value, _QuantizedEmbedding):
+            return value.values.astype(numpy.float32) * numpy.float32(value.scale)
+
+        return value
+
+    @staticmethod
+    def _get_cache_key_id(key: Hashable) -> Hashable:
+        """
+        Retrieves the identifier by which a key is tracked, which matches the form in which Theine reports evicted keys.
+
+        Theine stores str keys as-is, and int keys as their string form. All other keys are tracked as-is, as Theine
+        reports them by an internal identifier which cannot be mapped back to the key.
+
+        :param key: Normalized key.
+
+        :return: Identifier of the key.
+        """
+        if isinstance(key, int):
+            return f"{key}"
+
+        return key
+
+    def _track_cache_key(self, key: Hashable) -> NoReturn:
+        """
+        Records that a key was just used, by being added to or found in the cache, so that the most recently used
+        entries can be carried over when the cache is rebuilt.
+
+        At most as many keys as fit within the cache are tracked. This must be called while holding the cache lock.
+
+        :param key: Normalized key which was used.
+        """
+        key_id = self._get_cache_key_id(key)
+        self._cache_keys[key_id] = key
+        self._cache_keys.move_to_end(key_id)
+
+        if len(self._cache_keys) > self._cache_size:
+            self._cache_keys.popitem(last=False)
+
+    def _untrack_cache_key(self, key: Hashable) -> NoReturn:
+        """
+        Records that a key is no longer in the cache. This must be called while holding the cache lock.
+
+        :param key: Normalized key, or a key reported as evicted by Theine.
+        """
+        self._cache_keys.pop(self._get_cache_key_id(key), None)
+
+    def _set_in_cache(self, cache: Cache, key: Hashable, value: any) -> NoReturn:
+        """
+        Adds a key-value pair to the given cache, and tracks the key.
+
+        The key evicted by Theine, if any, is no longer tracked. This may be the added key itself, if the eviction policy
+        declined to admit it. This must be called while holding the cache lock.
+
+        :param cache: Cache to add to.
+        :param key: Normalized key to add.
+        :param value: Encoded value to add.
+        """
+        evicted_key = cache.set(key, value, self._cache_ttl)
+        self._track_cache_key(key)
+
+        if evicted_key is not None:
+            self._untrack_cache_key(evicted_key)
+
+    def _get_from_cache(self, cache: Cache, key: Hashable, default: any) -> any:
+        """
+        Retrieves a value from the given cache, and records the key as recently used if it was found, or as no longer
+        cached if it was not. This must be called while holding the cache lock.
+
+        :param cache: Cache to retrieve from.
+        :param key: Normalized key to retrieve.
+        :param default: Default value to return, if the key is not found.
+
+        :return: Encoded value from the cache, or the default value.
+        """
+        value = cache.get(key, _MISSING)
+
+        if value is _MISSING:
+            self._untrack_cache_key(key)
+            return default
+
+        self._track_cache_key(key)
+        return value
 
     def add_to_cache(self, key: Hashable, value: any) -> NoReturn:
         """
@@ -43,12 +331,62 @@ class EmbeddingWorker(MachineLearningWorker):
         :param key: Key to add.
         :param value: Value to add.
         """
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Adding KV pair to cache for %s:\nKey: %s\nValue: %s.", self._cls_name, key, value)
+
+        if self._cache is None:
+            return
+
+        key = self._normalize_key(key)
+        value = self._encode_cache_value(value)
+
         with self._cache_lock:
-            if self._cache is None:
+            cache = self._cache
+            if cache is None:
+                return
+
+            self._set_in_cache(cache, key, value)
+
+    async def add_to_cache_async(self, key: Hashable, value: any) -> NoReturn:
+        """
+        Adds a new key-value pair to the cache, without blocking the event loop on the cache lock.
+
+        The call to `add_to_cache` is run on a single-threaded pool dedicated to this worker's cache, which is created
+        on first use and can be shut down with `shutdown_cache_executor`.
+
+        :param key: Key to add.
+        :param value: Value to add.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_cache_executor(), self.add_to_cache, key, value)
+
+    def add_to_cache_many(self, items: Sequence[Tuple[Hashable, any]]) -> NoReturn:
+        """
+        Adds multiple key-value pairs to the cache, while acquiring the cache lock only once.
+
+        Values are stored by reference. If the values are the rows of a single batch of embeddings (e.g. the rows of a
+        2D numpy array), then the cached embeddings are views which share that batch's buffer, rather than copies.
+
+        Each view keeps the whole batch buffer alive, so the buffer is not freed until every row of the batch has been
+        evicted from the cache. To avoid this, pass copies of the rows. This does not apply while quantization is
+        enabled, as each quantized embedding is stored in a new INT8 array.
+
+        :param items: Key-value pairs to add.
+        """
+        self._logger.debug("Adding %s KV pairs to cache for %s.", len(items), self._cls_name)
+
+        if self._cache is None:
+            return
+
+        items = [(self._normalize_key(key), self._encode_cache_value(value)) for key, value in items]
+
+        with self._cache_lock:
+            cache = self._cache
+            if cache is None:
                 return
 
-            self._logger.debug(f"Adding KV pair to cache for {self.__class__.__name__}:\nKey: {key}\nValue: {value}.")
-            self._cache.set(key, value, self._cache_ttl)
+            for key, value in items:
+                self._set_in_cache(cache, key, value)
 
     def clear_cache(self) -> NoReturn:
         """
@@ -56,40 +394,94 @@ class EmbeddingWorker(MachineLearningWorker):
 
         :raises RuntimeError: If the cache is not enabled.
         """
+        self._logger.debug("Clearing cache for %s.", self._cls_name)
+
         with self._cache_lock:
             if self._cache is None:
                 raise RuntimeError("Cache is not enabled.")
 
-            self._logger.debug(f"Clearing cache for {self.__class__.__name__}.")
-
-            if self._cache is not None:
-                self._cache.clear()
+            self._cache.clear()
+            self._cache_keys.clear()
 
+    @validate_argument("`enabled`", bool, "a boolean")
     def enable_cache(self, enabled: bool) -> NoReturn:
         """
         En/disables the cache.
 
         :param enabled: Whether to enable the cache.
         """
-        if enabled is None:
-            raise ValueError("`enabled` cannot be None.")
+        self._logger.debug("Setting cache enabled to %s for %s.", enabled, self._cls_name)
 
-        if not isinstance(enabled, bool):
-            raise ValueError("`enabled` must be a boolean.")
+        if enabled:
+            if self._cache is None:
+                self._create_cache()
+
+            return
 
         with self._cache_lock:
-            self._logger.debug(f"Setting cache enabled to {enabled} for {self.__class__.__name__}.")
+            old_cache = self._cache
+            self._cache = None
+            self._cache_keys.clear()
 
-            if self._cache is None:
-                if enabled:
-                    self._create_cache()
-                else:
-                    pass
-            else:
-                if enabled:
-                    pass
-                else:
-                    self._cache = None
+        if old_cache is not None:
+            self._dispose_of_cache(old_cache)
+
+    def shutdown_cache_executor(self, wait: bool = True) -> NoReturn:
+        """
+        Shuts down the thread pool used by the asynchronous cache methods, if it has been created.
+
+        The cache itself is left as-is. If an asynchronous cache method is called afterwards, then a new thread pool is
+        created.
+
+        :param wait: Whether to wait for all pending calls to finish before returning.
+        """
+        with self._cache_executor_lock:
+            executor = self._cache_executor
+            self._cache_executor = None
+
+        if executor is not None:
+            self._logger.debug("Shutting down the cache executor for %s.", self._cls_name)
+            executor.shutdown(wait=wait)
+
+    def get_or_compute_many(self, keys: Sequence[Hashable], compute: callable) -> List[any]:
+        """
+        Retrieves the values of multiple keys from the cache, and computes the values of all missing keys with a single
+        call to the given function. The computed values are then added to the cache.
+
+        If the cache is not enabled, then the values of all keys are computed.
+
+        :param keys: Keys to retrieve.
+        :param compute: A callable function which accepts a list of keys, and returns a sequence of their values in the
+                        same order. This may be a 2D array, in which case its rows are cached as views, unless
+                        quantization is enabled. Each view keeps the whole array alive until every row has
+                        been evicted.
+
+        :return: Values of the keys, in the same order as the keys.
+
+        :raises ValueError: If `compute` does not return one value per key.
+        """
+        try:
+            values = self.retrieve_from_cache_many(keys, _MISSING)
+        except RuntimeError:
+            # The cache is not enabled, or was disabled by another thread.
+            return list(compute(list(keys)))
+
+        missing_keys = list(dict.fromkeys(key for key, value in zip(keys, values) if value is _MISSING))
+
+        if len(missing_keys) == 0:
+            return values
+
+        computed_values = list(compute(missing_keys))
+        if len(computed_values) != len(missing_keys):
+            raise ValueError(
+                f"`compute` must return one value per key. It returned {len(computed_values)} values for "
+                f"{len(missing_keys)} keys."
+            )
+
+        computed = dict(zip(missing_keys, computed_values))
+        self.add_to_cache_many(list(computed.items()))
+
+        return [computed[key] if value is _MISSING else value for key, value in zip(keys, values)]
 
     def remove_from_cache(self, key: Hashable) -> NoReturn:
         """
@@ -99,12 +491,20 @@ class EmbeddingWorker(MachineLearningWorker):
 
         :raises RuntimeError: If the cache is not enabled.
         """
+        self._logger.debug("Removing KV pair from cache for %s:\nKey: %s.", self._cls_name, key)
+
+        if self._cache is None:
+            raise RuntimeError("Cache is not enabled.")
+
+        key = self._normalize_key(key)
+
         with self._cache_lock:
-            if self._cache is None:
+            cache = self._cache
+            if cache is None:
                 raise RuntimeError("Cache is not enabled.")
 
-            self._logger.debug(f"Removing KV pair from cache for {self.__class__.__name__}:\nKey: {key}.")
-            self._cache.delete(key)
+            cache.delete(key)
+            self._untrack_cache_key(key)
 
     def retrieve_from_cache(self, key: Hashable, default: any = None) -> any:
         """
@@ -117,56 +517,135 @@ class EmbeddingWorker(MachineLearningWorker):
 
         :raises RuntimeError: If the cache is not enabled.
         """
+        self._logger.debug("Retrieving value from cache for %s:\nKey: %s.", self._cls_name, key)
+
+        if self._cache is None:
+            raise RuntimeError("Cache is not enabled.")
+
+        key = self._normalize_key(key)
+
         with self._cache_lock:
-            if self._cache is None:
+            cache = self._cache
+            if cache is None:
                 raise RuntimeError("Cache is not enabled.")
 
-            self._logger.debug(f"Retrieving value from cache for {self.__class__.__name__}:\nKey: {key}.")
-            return self._cache.get(key, default)
+            value = self._get_from_cache(cache, key, default)
 
-    def set_cache_eviction_policy(self, policy: str) -> NoReturn:
+        return self._decode_cache_value(value)
+
+    async def retrieve_from_cache_async(self, key: Hashable, default: any = None) -> any:
         """
-        Defines the eviction policy for the cache.
+        Retrieves a value from the cache, without blocking the event loop on the cache lock.
 
-        This will cause the cache to be cleared.
+        The call to `retrieve_from_cache` is run on a single-threaded pool dedicated to this worker's cache, which is
+        created on first use and can be shut down with `shutdown_cache_executor`.
 
-        :param policy: New cache eviction policy.
+        :param key: Key to retrieve.
+        :param default: Default value to return, if the key is not found.
+
+        :return: Value from the cache, or the default value.
+
+        :raises RuntimeError: If the cache is not enabled.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_cache_executor(), self.retrieve_from_cache, key, default)
+
+    def retrieve_from_cache_many(self, keys: Sequence[Hashable], default: any = None) -> List[any]:
+        """
+        Retrieves multiple values from the cache, while acquiring the cache lock only once.
+
+        :param keys: Keys to retrieve.
+        :param default: Default value to return for each key which is not found.
+
+        :return: Values from the cache, or the default value, in the same order as the keys.
+
+        :raises RuntimeError: If the cache is not enabled.
         """
-        if policy is None:
-            raise ValueError("Cache eviction policy cannot be None.")
+        self._logger.debug("Retrieving %s values from cache for %s.", len(keys), self._cls_name)
+
+        if self._cache is None:
+            raise RuntimeError("Cache is not enabled.")
 
-        if policy not in CORES.keys():
-            raise ValueError(f"Invalid cache eviction policy: {policy}\nAllowed policies: {CORES.keys()}")
+        keys = [self._normalize_key(key) for key in keys]
 
         with self._cache_lock:
-            self._logger.debug(f"Setting `_cache_eviction_policy` to {policy} for {self.__class__.__name__}.")
-            self._cache_eviction_policy = policy
+            cache = self._cache
+            if cache is None:
+                raise RuntimeError("Cache is not enabled.")
 
-        self._create_cache()
+            values = [self._get_from_cache(cache, key, default) for key in keys]
 
-    def set_cache_size(self, size: int) -> NoReturn:
+        return [self._decode_cache_value(value) for value in values]
+
+    @validate_argument(
+        "Cache eviction policy",
+        predicate=lambda policy: policy in CORES.keys(),
+        invalid_message=lambda policy: f"Invalid cache eviction policy: {policy}\nAllowed policies: {CORES.keys()}"
+    )
+    def set_cache_eviction_policy(self, policy: str) -> NoReturn:
         """
-        Defines the maximum number of elements that can be stored in the cache.
+        Defines the eviction policy for the cache.
 
-        This will cause the cache to be cleared.
+        The default policy is "tlfu" (W-TinyLFU), whose frequency-based admission filter keeps frequently requested
+        embeddings cached and prevents one-off inputs from evicting them.
 
-        :param size: New cache size.
+        The cache is rebuilt using the new policy, and its live entries are carried over, most recently used last.
+
+        :param policy: New cache eviction policy.
         """
-        if size is None:
-            raise ValueError("Cache size cannot be None.")
+        if policy == self._cache_eviction_policy:
+            return
 
-        if not isinstance(size, int):
-            raise ValueError(f"Cache size must be an integer.")
+        self._logger.debug("Setting `_cache_eviction_policy` to %s for %s.", policy, self._cls_name)
+        self._rebuild_cache(policy, self._cache_size)
 
-        if size <= 0:
-            raise ValueError(f"Cache size must be a positive, non-zero value. The given value was {size}.")
+    @validate_argument("`enabled`", bool, "a boolean")
+    def set_cache_quantization(self, enabled: bool) -> NoReturn:
+        """
+        En/disables the quantization of cached embeddings.
 
-        with self._cache_lock:
-            self._logger.debug(f"Setting `_cache_size` to {size} for {self.__class__.__name__}.")
-            self._cache_size = size
+        When enabled, FP32 numpy arrays are quantized to INT8 before being added to the cache, and are dequantized to
+        FP32 when retrieved. This reduces the memory used by each cached embedding by 4x, at the cost of a small loss of
+        precision. FP32 arrays containing NaN or infinite values, and all other values, are cached as-is.
 
-        self._create_cache()
+        This will not affect existing elements in the cache. Quantized elements are still dequantized when retrieved,
+        after quantization has been disabled.
+
+        :param enabled: Whether to quantize cached embeddings.
+
+        :raises ImportError: If quantization is being enabled, but numpy is not installed.
+        """
+        if enabled and numpy is None:
+            raise ImportError("numpy must be installed to quantize cached embeddings.")
 
+        self._logger.debug("Setting `_cache_quantization` to %s for %s.", enabled, self._cls_name)
+        self._cache_quantization = enabled
+
+    @validate_argument("Cache size", int, "an integer", lambda size: size > 0, "a positive, non-zero value")
+    def set_cache_size(self, size: int) -> NoReturn:
+        """
+        Defines the maximum number of elements that can be stored in the cache.
+
+        The cache is rebuilt using the new size, and its live entries are carried over. When shrinking the cache, only the
+        most recently used entries which fit within the new size are kept.
+
+        :param size: New cache size.
+        """
+        if size == self._cache_size:
+            return
+
+        self._logger.debug("Setting `_cache_size` to %s for %s.", size, self._cls_name)
+        self._rebuild_cache(self._cache_eviction_policy, size)
+
+    @validate_argument(
+        "Cache TTL",
+        timedelta,
+        "a timedelta object",
+        lambda ttl: ttl.total_seconds() > 0,
+        invalid_message=lambda ttl: (
+            f"Cache TTL must be a positive, non-zero value. The given value was {ttl.total_seconds()}."
+        )
+    )
     def set_cache_ttl(self, ttl: timedelta) -> NoReturn:
         """
         Defines the TTL (time-to-live) for elements in the cache.
@@ -174,18 +653,12 @@ class EmbeddingWorker(MachineLearningWorker):
         This will not affect existing elements in the cache, nor will it clear the cache. However, all future elements
         will be subject to this TTL.
 
+        Expiry is handled by Theine's Rust core, not in Python. Retrieving an element checks whether it has expired
+        within the core's lookup, and the cache's background maintenance thread periodically removes expired elements.
+
         :param ttl: New cache TTL.
         """
-        if ttl is None:
-            raise ValueError("Cache TTL cannot be None.")
-
-        if not isinstance(ttl, timedelta):
-            raise ValueError(f"Cache TTL must be a timedelta object.")
-
-        if ttl.total_seconds() <= 0:
-            raise ValueError(
-                f"Cache TTL must be a positive, non-zero value. The given value was {ttl.total_seconds()}.")
+        self._logger.debug("Setting `_cache_ttl` to %s for %s.", ttl, self._cls_name)
 
         with self._cache_lock:
-            self._logger.debug(f"Setting `_cache_ttl` to {ttl} for {self.__class__.__name__}.")
             self._cache_ttl = ttl
@@ -0,0 +1,64 @@
+import inspect
+
+from functools import wraps
+from typing import Optional
+
+
+def validate_argument(
+    name: str,
+    expected_type: Optional[type] = None,
+    type_description: Optional[str] = None,
+    predicate: Optional[callable] = None,
+    requirement: Optional[str] = None,
+    invalid_message: Optional[callable] = None
+) -> callable:
+    """
+    Creates a decorator which validates the first argument, after `self`, of a method before the method is called.
+
+    The argument may be passed either positionally or by keyword. Its name is looked up once, when the method is
+    decorated.
+
+    The argument is always checked to not be None. It is then, optionally, checked to be an instance of the expected
+    type and to satisfy the predicate.
+
+    :param name: Name of the argument, as used in error messages.
+    :param expected_type: Type, or tuple of types, which the argument must be an instance of.
+    :param type_description: Description of the expected type, as used in error messages. e.g. "an integer".
+    :param predicate: A callable function which returns whether the argument is valid.
+    :param requirement: Description of what the predicate requires, as used in error messages. e.g. "positive".
+    :param invalid_message: A callable function which accepts the argument, and returns the error message to use when
+                            the predicate is not satisfied. Overrides the message built from `requirement`.
+
+    :return: Decorator which validates the argument.
+
+    :raises ValueError: From the decorated method, if the argument is invalid.
+    """
+    def decorator(method: callable) -> callable:
+        parameter_name = list(inspect.signature(method).parameters)[1]
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if len(args) > 0:
+                value = args[0]
+            elif parameter_name in kwargs:
+                value = kwargs[parameter_name]
+            else:
+                return method(self, *args, **kwargs)
+
+            if value is None:
+                raise ValueError(f"{name} cannot be None.")
+
+            if expected_type is not None and not isinstance(value, expected_type):
+                raise ValueError(f"{name} must be {type_description}.")
+
+            if predicate is not None and not predicate(value):
+                if invalid_message is not None:
+                    raise ValueError(invalid_message(value))
+
+                raise ValueError(f"{name} must be {requirement}. The given value was {value}.")
+
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator